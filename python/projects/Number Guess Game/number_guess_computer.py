@@ -1,5 +1,3 @@
-import random
-
 def computer_guess():
     low = 1
     high = 100
@@ -9,7 +7,7 @@ def computer_guess():
     print("Great! Now I'll try to guess it.")
     
     while True:
-        guess = random.randint(low, high)
+        guess = (low + high) // 2  # binary search: at most 7 guesses for 1-100
         attempts += 1
         print(f"I guess {guess}")
         
@@ -17,14 +15,17 @@ def computer_guess():
             print(f"Yay! I guessed it right: {guess} in {attempts} attempts.")
             break
 
-        elif guess!=secret_number:
-            user=input("Is the number high or low?").lower()
-            if user=="high":
+        else:
+            user=input("Is the number high or low?")[:1].lower()
+            if user=="h":
                 print("High! I'll guess lower.")
                 high=guess-1
-            elif user=="low":
+            elif user=="l":
                 print("low! I'll guess higher.")
                 low=guess+1
+            else:
+                print("Please answer high or low.")
+                attempts -= 1
         # elif guess > secret_number:
         #     print("Too high! I'll guess lower.")
         #     high = guess - 1
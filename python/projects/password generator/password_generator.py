@@ -1,17 +1,20 @@
 import random
 
+ALPHABET = 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ'
+DIGITS = '0123456789'
+SPECIAL_CHARS = '!@#$%^&*()_+-=[]{}|;:,.<>?/'
+
+# OS-backed randomness, safe for passwords unlike the default Mersenne Twister
+rng = random.SystemRandom()
+
 def generate_password(letters, numbers, symbols):
-    alphabet = 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ'
-    digits = '0123456789'
-    special_chars = '!@#$%^&*()_+-=[]{}|;:,.<>?/'
-    
     password_chars = (
-        random.choices(alphabet, k=letters) +
-        random.choices(digits, k=numbers) +
-        random.choices(special_chars, k=symbols)
+        rng.choices(ALPHABET, k=letters) +
+        rng.choices(DIGITS, k=numbers) +
+        rng.choices(SPECIAL_CHARS, k=symbols)
     )
     
-    random.shuffle(password_chars)
+    rng.shuffle(password_chars)
     return ''.join(password_chars)
 
 letters = int(input("Enter number of letters: "))
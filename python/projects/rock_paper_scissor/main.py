@@ -27,21 +27,17 @@ scissors = '''
 ---.__(___)
 '''
 game_list=[rock,paper,scissors]
+# outcomes[your_choice][ai] for rock=0, paper=1, scissors=2
+outcomes=(("It's a draw!","You lose","You win"),
+          ("You win","It's a draw!","You lose"),
+          ("You lose","You win","It's a draw!"))
 your_choice=int(input("What do you choose? Type 0 for Rock, 1 for Paper or 2 for Scissors. \n"))
-if your_choice<=3 and your_choice>0:
+if 0<=your_choice<=2:
      print(game_list[your_choice])
 ai=random.randint(0,2)
 print('computer choose:')
 print(game_list[ai])
-if your_choice >= 3 or your_choice < 0:
+if 0<=your_choice<=2:
+    print(outcomes[your_choice][ai])
+else:
     print("you typed an invalid number")
-elif ai==your_choice:
-    print('It\'s a draw!')
-elif ai>your_choice:
-    print("You win")
-elif ai<your_choice:
-    print("You lose")
-elif ai==0 and your_choice==2:
-    print("You lose")
-elif ai==2 and your_choice==0:
-    print("You win")